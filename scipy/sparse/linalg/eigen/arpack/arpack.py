@@ -1695,8 +1695,9 @@ def eigsh(A, k=6, M=None, sigma=None, which='LM', v0=None,
 def _augmented_orthonormal_cols(x, k):
     # extract the shape of the x array
     n, m = x.shape
-    # create the expanded array and copy x into it
-    y = np.empty((n, m+k), dtype=x.dtype)
+    # create the expanded array and copy x into it; the columns are kept
+    # contiguous so that the inner products below work on them in place
+    y = np.empty((n, m+k), dtype=x.dtype, order='F')
     y[:, :m] = x
     # do some modified gram schmidt to add k random orthonormal vectors
     for i in range(k):
@@ -1707,9 +1708,9 @@ def _augmented_orthonormal_cols(x, k):
         # subtract projections onto the existing unit length vectors
         for j in range(m+i):
             u = y[:, j]
-            v -= (np.dot(v, u.conj()) / np.dot(u, u.conj())) * u
+            v -= (np.vdot(u, v) / np.vdot(u, u)) * u
         # normalize v
-        v /= np.sqrt(np.dot(v, v.conj()))
+        v /= np.sqrt(np.vdot(v, v))
         # add v into the output array
         y[:, m+i] = v
     # return the expanded array
@@ -577,19 +577,30 @@ class _TransposedLinearOperator(LinearOperator):
         super(_TransposedLinearOperator, self).__init__(dtype=A.dtype, shape=shape)
         self.A = A
         self.args = (A,)
+        # For real operators A^T == A^H, so the conjugations are no-ops
+        # (but would still copy their argument)
+        self._real = A.dtype is not None and A.dtype.kind in 'biuf'
 
     def _matvec(self, x):
+        if self._real:
+            return self.A._rmatvec(x)
         # NB. np.conj works also on sparse matrices
         return np.conj(self.A._rmatvec(np.conj(x)))
 
     def _rmatvec(self, x):
+        if self._real:
+            return self.A._matvec(x)
         return np.conj(self.A._matvec(np.conj(x)))
 
     def _matmat(self, x):
+        if self._real:
+            return self.A._rmatmat(x)
         # NB. np.conj works also on sparse matrices
         return np.conj(self.A._rmatmat(np.conj(x)))
 
     def _rmatmat(self, x):
+        if self._real:
+            return self.A._matmat(x)
         return np.conj(self.A._matmat(np.conj(x)))
 
 def _get_dtype(operators, dtypes=None):
@@ -727,6 +738,14 @@ class MatrixLinearOperator(LinearOperator):
         self.__adj = None
         self.args = (A,)
 
+    def _matvec(self, x):
+        # go straight to A.dot instead of the default reshape + matmat
+        # round trip, which redoes the argument checks on every call
+        return self.A.dot(x)
+
+    def _rmatvec(self, x):
+        return self._adjoint().A.dot(x)
+
     def _matmat(self, X):
         return self.A.dot(X)
 
@@ -737,7 +756,12 @@ class MatrixLinearOperator(LinearOperator):
 
 class _AdjointMatrixOperator(MatrixLinearOperator):
     def __init__(self, adjoint):
-        self.A = adjoint.A.T.conj()
+        A = adjoint.A.T
+        if A.dtype.kind not in 'biuf':
+            # only conjugate where it is not a no-op: for real sparse
+            # matrices conj() would still copy the data
+            A = A.conj()
+        self.A = A
         self.__adjoint = adjoint
         self.args = (adjoint,)
         self.shape = adjoint.shape[1], adjoint.shape[0]
@@ -7,8 +7,9 @@ import numpy as np
 
 from . import _iterative
 
-from scipy.sparse.linalg.interface import LinearOperator
-from .utils import make_system
+from scipy.linalg import get_blas_funcs
+from scipy.sparse.linalg.interface import LinearOperator, IdentityOperator
+from .utils import make_system, id as _identity
 from scipy._lib._util import _aligned_zeros
 from scipy._lib._threadsafety import non_reentrant
 
@@ -68,13 +69,55 @@ def _stoptest(residual, atol):
     """
     Successful termination condition for the solvers.
     """
-    resid = np.linalg.norm(residual)
-    if resid <= atol:
+    # The squared norm comes out of a single conjugated dot product and
+    # is compared against the squared tolerance directly.
+    resid2 = float(np.vdot(residual, residual).real)
+    resid = float(np.sqrt(resid2))
+    if resid2 <= atol*atol:
         return resid, 1
     else:
         return resid, 0
 
 
+def _matvec_update(work, slc, sclr1, sclr2, y):
+    """
+    Compute ``work[slc] = sclr1*y + sclr2*work[slc]`` in place, as
+    requested by the MATVEC jobs of the reverse-communication routines.
+    """
+    if sclr2 == 0:
+        # Overwrite, as ?gemv does for beta == 0: avoids a separate
+        # scaling pass over the work vector and a temporary for sclr1*y.
+        if sclr1 == 1:
+            # same_kind, as the ufunc branches: never drop an imaginary part
+            np.copyto(work[slc], y, casting='same_kind')
+        else:
+            np.multiply(y, sclr1, out=work[slc])
+    elif not np.can_cast(y.dtype, work.dtype, 'same_kind'):
+        # f2py would force-cast y for ?axpy and drop its imaginary part;
+        # let the ufuncs raise instead
+        w = work[slc]
+        w *= sclr2
+        w += sclr1*y
+    else:
+        w = work[slc]
+        axpy, scal = get_blas_funcs(('axpy', 'scal'), (w,))
+        if sclr2 != 1:
+            w = scal(sclr2, w)
+        work[slc] = axpy(y, w, w.shape[0], sclr1)  # w = sclr1*y + sclr2*w
+
+
+def _get_psolve(M, adjoint=False):
+    """
+    Return the function applying ``M`` (or ``M^H``) for the PSOLVE jobs.
+
+    The identity preconditioner is bypassed: its result is copied into
+    the work array anyway, so the LinearOperator call is pure overhead.
+    """
+    if isinstance(M, IdentityOperator):
+        return _identity
+    return M.rmatvec if adjoint else M.matvec
+
+
 def _get_atol(tol, atol, bnrm2, get_residual, routine_name):
     """
     Parse arguments for absolute tolerance in termination condition.
@@ -155,7 +198,7 @@ def bicg(A, b, x0=None, tol=1e-5, maxiter=None, M=None, callback=None, atol=None
         maxiter = n*10
 
     matvec, rmatvec = A.matvec, A.rmatvec
-    psolve, rpsolve = M.matvec, M.rmatvec
+    psolve, rpsolve = _get_psolve(M), _get_psolve(M, adjoint=True)
     ltr = _type_conv[x.dtype.char]
     revcom = getattr(_iterative, ltr + 'bicgrevcom')
 
@@ -186,18 +229,17 @@ def bicg(A, b, x0=None, tol=1e-5, maxiter=None, M=None, callback=None, atol=None
                 callback(x)
             break
         elif (ijob == 1):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*matvec(work[slice1])
+            _matvec_update(work, slice2, sclr1, sclr2,
+                           matvec(work[slice1]))
         elif (ijob == 2):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*rmatvec(work[slice1])
+            _matvec_update(work, slice2, sclr1, sclr2,
+                           rmatvec(work[slice1]))
         elif (ijob == 3):
             work[slice1] = psolve(work[slice2])
         elif (ijob == 4):
             work[slice1] = rpsolve(work[slice2])
         elif (ijob == 5):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*matvec(x)
+            _matvec_update(work, slice2, sclr1, sclr2, matvec(x))
         elif (ijob == 6):
             if ftflag:
                 info = -1
@@ -227,7 +269,7 @@ def bicgstab(A, b, x0=None, tol=1e-5, maxiter=None, M=None, callback=None, atol=
         maxiter = n*10
 
     matvec = A.matvec
-    psolve = M.matvec
+    psolve = _get_psolve(M)
     ltr = _type_conv[x.dtype.char]
     revcom = getattr(_iterative, ltr + 'bicgstabrevcom')
 
@@ -258,13 +300,12 @@ def bicgstab(A, b, x0=None, tol=1e-5, maxiter=None, M=None, callback=None, atol=
                 callback(x)
             break
         elif (ijob == 1):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*matvec(work[slice1])
+            _matvec_update(work, slice2, sclr1, sclr2,
+                           matvec(work[slice1]))
         elif (ijob == 2):
             work[slice1] = psolve(work[slice2])
         elif (ijob == 3):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*matvec(x)
+            _matvec_update(work, slice2, sclr1, sclr2, matvec(x))
         elif (ijob == 4):
             if ftflag:
                 info = -1
@@ -294,7 +335,7 @@ def cg(A, b, x0=None, tol=1e-5, maxiter=None, M=None, callback=None, atol=None):
         maxiter = n*10
 
     matvec = A.matvec
-    psolve = M.matvec
+    psolve = _get_psolve(M)
     ltr = _type_conv[x.dtype.char]
     revcom = getattr(_iterative, ltr + 'cgrevcom')
 
@@ -325,13 +366,12 @@ def cg(A, b, x0=None, tol=1e-5, maxiter=None, M=None, callback=None, atol=None):
                 callback(x)
             break
         elif (ijob == 1):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*matvec(work[slice1])
+            _matvec_update(work, slice2, sclr1, sclr2,
+                           matvec(work[slice1]))
         elif (ijob == 2):
             work[slice1] = psolve(work[slice2])
         elif (ijob == 3):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*matvec(x)
+            _matvec_update(work, slice2, sclr1, sclr2, matvec(x))
         elif (ijob == 4):
             if ftflag:
                 info = -1
@@ -340,7 +380,7 @@ def cg(A, b, x0=None, tol=1e-5, maxiter=None, M=None, callback=None, atol=None):
             if info == 1 and iter_ > 1:
                 # recompute residual and recheck, to avoid
                 # accumulating rounding error
-                work[slice1] = b - matvec(x)
+                np.subtract(b, matvec(x), out=work[slice1])
                 resid, info = _stoptest(work[slice1], atol)
         ijob = 2
 
@@ -365,7 +405,7 @@ def cgs(A, b, x0=None, tol=1e-5, maxiter=None, M=None, callback=None, atol=None)
         maxiter = n*10
 
     matvec = A.matvec
-    psolve = M.matvec
+    psolve = _get_psolve(M)
     ltr = _type_conv[x.dtype.char]
     revcom = getattr(_iterative, ltr + 'cgsrevcom')
 
@@ -396,13 +436,12 @@ def cgs(A, b, x0=None, tol=1e-5, maxiter=None, M=None, callback=None, atol=None)
                 callback(x)
             break
         elif (ijob == 1):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*matvec(work[slice1])
+            _matvec_update(work, slice2, sclr1, sclr2,
+                           matvec(work[slice1]))
         elif (ijob == 2):
             work[slice1] = psolve(work[slice2])
         elif (ijob == 3):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*matvec(x)
+            _matvec_update(work, slice2, sclr1, sclr2, matvec(x))
         elif (ijob == 4):
             if ftflag:
                 info = -1
@@ -411,7 +450,7 @@ def cgs(A, b, x0=None, tol=1e-5, maxiter=None, M=None, callback=None, atol=None)
             if info == 1 and iter_ > 1:
                 # recompute residual and recheck, to avoid
                 # accumulating rounding error
-                work[slice1] = b - matvec(x)
+                np.subtract(b, matvec(x), out=work[slice1])
                 resid, info = _stoptest(work[slice1], atol)
         ijob = 2
 
@@ -561,12 +600,11 @@ def gmres(A, b, x0=None, tol=1e-5, restart=None, maxiter=None, M=None, callback=
     restrt = min(restrt, n)
 
     matvec = A.matvec
-    psolve = M.matvec
+    psolve = _get_psolve(M)
     ltr = _type_conv[x.dtype.char]
     revcom = getattr(_iterative, ltr + 'gmresrevcom')
 
-    bnrm2 = np.linalg.norm(b)
-    Mb_nrm2 = np.linalg.norm(psolve(b))
+    bnrm2 = float(np.linalg.norm(b))
     get_residual = lambda: np.linalg.norm(matvec(x) - b)
     atol = _get_atol(tol, atol, bnrm2, get_residual, 'gmres')
     if atol == 'exit':
@@ -575,6 +613,8 @@ def gmres(A, b, x0=None, tol=1e-5, restart=None, maxiter=None, M=None, callback=
     if bnrm2 == 0:
         return postprocess(b), 0
 
+    Mb_nrm2 = float(np.linalg.norm(psolve(b)))
+
     # Tolerance passed to GMRESREVCOM applies to the inner iteration
     # and deals with the left-preconditioned residual.
     ptol_max_factor = 1.0
@@ -594,24 +634,27 @@ def gmres(A, b, x0=None, tol=1e-5, restart=None, maxiter=None, M=None, callback=
     first_pass = True
     resid_ready = False
     iter_num = 1
+    # The callback mode is loop invariant, so resolve it only once
+    callback_x = (callback_type == 'x')
+    callback_pr_norm = callback_type in ('pr_norm', 'legacy')
+    legacy = (callback_type == 'legacy')
     while True:
         olditer = iter_
         x, iter_, presid, info, ndx1, ndx2, sclr1, sclr2, ijob = \
            revcom(b, x, restrt, work, work2, iter_, presid, info, ndx1, ndx2, ijob, ptol)
-        if callback_type == 'x' and iter_ != olditer:
+        if callback_x and iter_ != olditer:
             callback(x)
         slice1 = slice(ndx1-1, ndx1-1+n)
         slice2 = slice(ndx2-1, ndx2-1+n)
         if (ijob == -1):  # gmres success, update last residual
-            if callback_type in ('pr_norm', 'legacy'):
+            if callback_pr_norm:
                 if resid_ready:
                     callback(presid / bnrm2)
-            elif callback_type == 'x':
+            elif callback_x:
                 callback(x)
             break
         elif (ijob == 1):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*matvec(x)
+            _matvec_update(work, slice2, sclr1, sclr2, matvec(x))
         elif (ijob == 2):
             work[slice1] = psolve(work[slice2])
             if not first_pass and old_ijob == 3:
@@ -619,10 +662,10 @@ def gmres(A, b, x0=None, tol=1e-5, restart=None, maxiter=None, M=None, callback=
 
             first_pass = False
         elif (ijob == 3):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*matvec(work[slice1])
+            _matvec_update(work, slice2, sclr1, sclr2,
+                           matvec(work[slice1]))
             if resid_ready:
-                if callback_type in ('pr_norm', 'legacy'):
+                if callback_pr_norm:
                     callback(presid / bnrm2)
                 resid_ready = False
                 iter_num = iter_num+1
@@ -648,7 +691,7 @@ def gmres(A, b, x0=None, tol=1e-5, restart=None, maxiter=None, M=None, callback=
         old_ijob = ijob
         ijob = 2
 
-        if callback_type == 'legacy':
+        if legacy:
             # Legacy behavior
             if iter_num > maxiter:
                 info = maxiter
@@ -747,19 +790,20 @@ def qmr(A, b, x0=None, tol=1e-5, maxiter=None, M1=None, M2=None, callback=None,
             M1 = LinearOperator(A.shape, matvec=left_psolve, rmatvec=left_rpsolve)
             M2 = LinearOperator(A.shape, matvec=right_psolve, rmatvec=right_rpsolve)
         else:
-            def id(b):
-                return b
-            M1 = LinearOperator(A.shape, matvec=id, rmatvec=id)
-            M2 = LinearOperator(A.shape, matvec=id, rmatvec=id)
+            M1 = IdentityOperator(A.shape, dtype=A.dtype)
+            M2 = IdentityOperator(A.shape, dtype=A.dtype)
 
     n = len(b)
     if maxiter is None:
         maxiter = n*10
 
+    matvec, rmatvec = A.matvec, A.rmatvec
+    psolve1, rpsolve1 = _get_psolve(M1), _get_psolve(M1, adjoint=True)
+    psolve2, rpsolve2 = _get_psolve(M2), _get_psolve(M2, adjoint=True)
     ltr = _type_conv[x.dtype.char]
     revcom = getattr(_iterative, ltr + 'qmrrevcom')
 
-    get_residual = lambda: np.linalg.norm(A.matvec(x) - b)
+    get_residual = lambda: np.linalg.norm(matvec(x) - b)
     atol = _get_atol(tol, atol, np.linalg.norm(b), get_residual, 'qmr')
     if atol == 'exit':
         return postprocess(x), 0
@@ -786,22 +830,21 @@ def qmr(A, b, x0=None, tol=1e-5, maxiter=None, M1=None, M2=None, callback=None,
                 callback(x)
             break
         elif (ijob == 1):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*A.matvec(work[slice1])
+            _matvec_update(work, slice2, sclr1, sclr2,
+                           matvec(work[slice1]))
         elif (ijob == 2):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*A.rmatvec(work[slice1])
+            _matvec_update(work, slice2, sclr1, sclr2,
+                           rmatvec(work[slice1]))
         elif (ijob == 3):
-            work[slice1] = M1.matvec(work[slice2])
+            work[slice1] = psolve1(work[slice2])
         elif (ijob == 4):
-            work[slice1] = M2.matvec(work[slice2])
+            work[slice1] = psolve2(work[slice2])
         elif (ijob == 5):
-            work[slice1] = M1.rmatvec(work[slice2])
+            work[slice1] = rpsolve1(work[slice2])
         elif (ijob == 6):
-            work[slice1] = M2.rmatvec(work[slice2])
+            work[slice1] = rpsolve2(work[slice2])
         elif (ijob == 7):
-            work[slice2] *= sclr2
-            work[slice2] += sclr1*A.matvec(x)
+            _matvec_update(work, slice2, sclr1, sclr2, matvec(x))
         elif (ijob == 8):
             if ftflag:
                 info = -1
@@ -237,7 +237,7 @@ def lsmr(A, b, damp=0.0, atol=1e-6, btol=1e-6, conlim=1e8,
     normb = norm(b)
     if x0 is None:
         x = zeros(n, dtype)
-        beta = normb.copy()
+        beta = normb
     else:
         x = atleast_1d(x0)
         u = u - A.matvec(x)
@@ -53,6 +53,7 @@ __all__ = ['lsqr']
 
 import numpy as np
 from math import sqrt
+from scipy.linalg import get_blas_funcs
 from scipy.sparse.linalg.interface import aslinearoperator
 
 eps = np.finfo(np.float64).eps
@@ -316,6 +317,18 @@ def lsqr(A, b, damp=0.0, atol=1e-8, btol=1e-8, conlim=1e8,
         iter_lim = 2 * n
     var = np.zeros(n)
 
+    # u, v and w stay in the precision of A and b (at least single), so
+    # the products with A need no upcast; x is kept in at least double
+    dtype = np.result_type(A.dtype, b.dtype, np.float32)
+    if x0 is not None and np.iscomplexobj(x0):
+        # b - A*x0 is complex even for a real problem
+        dtype = np.result_type(dtype, np.complex64)
+    nrm2, axpy, scal = get_blas_funcs(('nrm2', 'axpy', 'scal'), dtype=dtype)
+    if x0 is None:
+        x_dtype = np.result_type(dtype, float)
+    else:
+        x_dtype = np.result_type(dtype, np.asarray(x0), float)
+
     msg = ('The exact solution is  x = 0                              ',
          'Ax - b is small enough, given atol, btol                  ',
          'The least-squares solution is good enough, given atol     ',
@@ -360,24 +373,27 @@ def lsqr(A, b, damp=0.0, atol=1e-8, btol=1e-8, conlim=1e8,
     u = b
     bnorm = np.linalg.norm(b)
     if x0 is None:
-        x = np.zeros(n)
-        beta = bnorm.copy()
+        x = np.zeros(n, x_dtype)
+        beta = bnorm
     else:
-        x = np.asarray(x0)
+        # x is updated in place below, so never alias the caller's x0.
+        x = np.array(x0, dtype=x_dtype)
         u = u - A.matvec(x)
-        beta = np.linalg.norm(u)
+        beta = nrm2(u)
 
+    # u and v are updated in place in the main loop, so give them their
+    # own storage of the working dtype here (u may still be b)
     if beta > 0:
-        u = (1/beta) * u
+        u = np.multiply(1/beta, u, dtype=dtype)
         v = A.rmatvec(u)
-        alfa = np.linalg.norm(v)
+        alfa = nrm2(v)
     else:
-        v = x.copy()
+        # arnorm == 0 below, so we return before v is used
+        v = x
         alfa = 0
 
     if alfa > 0:
-        v = (1/alfa) * v
-    w = v.copy()
+        v = np.multiply(1/alfa, v, dtype=dtype)
 
     rhobar = alfa
     phibar = beta
@@ -392,6 +408,9 @@ def lsqr(A, b, damp=0.0, atol=1e-8, btol=1e-8, conlim=1e8,
         print(msg[0])
         return x, istop, itn, r1norm, r2norm, anorm, acond, arnorm, xnorm, var
 
+    # w is updated in place, so it needs its own storage of the BLAS dtype
+    w = v.astype(dtype)
+
     head1 = '   Itn      x[0]       r1norm     r2norm '
     head2 = ' Compatible    LS      Norm A   Cond A'
 
@@ -414,20 +433,22 @@ def lsqr(A, b, damp=0.0, atol=1e-8, btol=1e-8, conlim=1e8,
         %                beta*u  =  a*v   -  alfa*u,
         %                alfa*v  =  A'*u  -  beta*v.
         """
-        u = A.matvec(v) - alfa * u
-        beta = np.linalg.norm(u)
+        u *= -alfa
+        u += A.matvec(v)
+        beta = nrm2(u)
 
         if beta > 0:
-            u = (1/beta) * u
-            anorm = sqrt(anorm**2 + alfa**2 + beta**2 + damp**2)
-            v = A.rmatvec(u) - beta * v
-            alfa = np.linalg.norm(v)
+            u *= (1 / beta)
+            anorm = sqrt(anorm**2 + alfa**2 + beta**2 + dampsq)
+            v *= -beta
+            v += A.rmatvec(u)
+            alfa = nrm2(v)
             if alfa > 0:
-                v = (1 / alfa) * v
+                v *= (1 / alfa)
 
         # Use a plane rotation to eliminate the damping parameter.
         # This alters the diagonal (rhobar) of the lower-bidiagonal matrix.
-        rhobar1 = sqrt(rhobar**2 + damp**2)
+        rhobar1 = sqrt(rhobar**2 + dampsq)
         cs1 = rhobar / rhobar1
         sn1 = damp / rhobar1
         psi = sn1 * phibar
@@ -446,15 +467,19 @@ def lsqr(A, b, damp=0.0, atol=1e-8, btol=1e-8, conlim=1e8,
         # Update x and w.
         t1 = phi / rho
         t2 = -theta / rho
-        dk = (1 / rho) * w
-
-        x = x + t1 * w
-        w = v + t2 * w
-        ddnorm = ddnorm + np.linalg.norm(dk)**2
+        ddnorm = ddnorm + (nrm2(w) / rho)**2
 
         if calc_var:
+            dk = (1 / rho) * w
             var = var + dk**2
 
+        if x.dtype == dtype:
+            x = axpy(w, x, n, t1)
+        else:
+            x += t1 * w
+        w = scal(t2, w)
+        w = axpy(v, w, n)
+
         # Use a plane rotation on the right to eliminate the
         # super-diagonal element (theta) of the upper-bidiagonal matrix.
         # Then use the result to estimate norm(x).
@@ -510,6 +510,18 @@ def test_x0_working(solver):
     assert_(np.linalg.norm(A.dot(x) - b) <= 1e-6*np.linalg.norm(b))
 
 
+@pytest.mark.parametrize("solver", [cg, cgs, bicg, bicgstab, gmres, qmr])
+def test_complex_matvec_real_operator(solver):
+    # A complex product must not be silently truncated into the real
+    # work array of an operator that claims a real dtype
+    M = (2 + 1j)*np.eye(5)
+    A = LinearOperator((5, 5), matvec=M.dot, rmatvec=M.conj().T.dot,
+                       dtype=np.float64)
+    b = np.ones(5)
+
+    assert_raises(TypeError, solver, A, b, atol=0)
+
+
 #------------------------------------------------------------------------------
 
 class TestQMR(object):
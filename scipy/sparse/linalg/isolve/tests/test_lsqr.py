@@ -1,6 +1,7 @@
 import numpy as np
 from numpy.testing import (assert_, assert_equal, assert_almost_equal,
-                           assert_array_almost_equal)
+                           assert_array_almost_equal, assert_array_equal,
+                           assert_allclose)
 
 import scipy.sparse
 import scipy.sparse.linalg
@@ -104,6 +105,82 @@ def test_initialization():
     assert_(np.all(b_copy == b))
 
 
+def test_complex_problem():
+    # Compare against the dense least-squares solution
+    rng = np.random.RandomState(1234)
+    A = rng.rand(20, 8) + 1j*rng.rand(20, 8)
+    b = rng.rand(20) + 1j*rng.rand(20)
+
+    x = lsqr(A, b, atol=tol, btol=tol, iter_lim=100)[0]
+
+    x_ref = np.linalg.lstsq(A, b, rcond=None)[0]
+    assert_equal(x.dtype, np.complex128)
+    assert_allclose(x, x_ref, rtol=1e-8)
+
+
+def test_x0_not_modified():
+    x0 = np.ones(n)
+    x0_copy = x0.copy()
+    x = lsqr(G, b, show=show, atol=tol, btol=tol, iter_lim=maxit, x0=x0)[0]
+    assert_array_equal(x0, x0_copy)
+    assert_(not np.may_share_memory(x, x0))
+
+
+def test_calc_var():
+    # calc_var must not change the solution. With as many iterations as
+    # columns, var is the diagonal of (A'A)^{-1} up to rounding.
+    rng = np.random.RandomState(1234)
+    A = rng.rand(20, 3) + 2*np.eye(20, 3)
+    b = rng.rand(20)
+
+    out = lsqr(A, b, atol=tol, btol=tol, iter_lim=100)
+    out_var = lsqr(A, b, atol=tol, btol=tol, iter_lim=100, calc_var=True)
+
+    assert_array_equal(out_var[0], out[0])
+    assert_equal(out_var[2], out[2])
+    assert_array_equal(out[-1], np.zeros(3))
+    assert_allclose(out_var[-1], np.diag(np.linalg.inv(A.T.dot(A))),
+                    rtol=1e-8)
+
+
+def test_integer_rhs():
+    A = np.array([[1, 2], [3, 4], [5, 6]])
+    b = np.array([1, 2, 4])
+
+    x = lsqr(A, b, atol=tol, btol=tol)[0]
+
+    assert_equal(x.dtype, np.float64)
+    assert_allclose(x, np.linalg.lstsq(A, b, rcond=None)[0], rtol=1e-8)
+
+
+def test_float32_vectors():
+    # The vectors of a single precision problem stay in single precision,
+    # so the products with A are not upcast, while x is kept in double
+    rng = np.random.RandomState(1234)
+    M = (rng.rand(20, 8) + 2*np.eye(20, 8)).astype(np.float32)
+    b = rng.rand(20).astype(np.float32)
+
+    dtypes = []
+
+    def matvec(x):
+        dtypes.append(x.dtype)
+        return M.dot(x)
+
+    def rmatvec(x):
+        dtypes.append(x.dtype)
+        return M.T.dot(x)
+
+    A = scipy.sparse.linalg.LinearOperator(M.shape, matvec=matvec,
+                                           rmatvec=rmatvec, dtype=np.float32)
+    x = lsqr(A, b, atol=1e-6, btol=1e-6)[0]
+
+    assert_(len(dtypes) > 2)
+    assert_(all(dt == np.float32 for dt in dtypes))
+    assert_equal(x.dtype, np.float64)
+    assert_allclose(x, np.linalg.lstsq(M.astype(np.float64), b, rcond=None)[0],
+                    rtol=1e-4)
+
+
 if __name__ == "__main__":
     svx = np.linalg.solve(G, b)
 
@@ -6,3 +6,11 @@ from scipy.sparse.linalg import utils
 
 def test_make_system_bad_shape():
     assert_raises(ValueError, utils.make_system, np.zeros((5,3)), None, np.zeros(4), np.zeros(4))
+
+
+def test_make_system_integer_rhs():
+    A = np.eye(3, dtype=np.float32)
+    b = np.arange(3)
+    A, M, x, b, postprocess = utils.make_system(A, None, None, b)
+    assert b.dtype == np.float64
+    assert x.dtype == np.float64
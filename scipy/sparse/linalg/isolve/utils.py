@@ -74,9 +74,6 @@ def make_system(A, M, x0, b):
         raise ValueError('shapes of A {} and b {} are incompatible'
                          .format(A.shape, b.shape))
 
-    if b.dtype.char not in 'fdFD':
-        b = b.astype('d')  # upcast non-FP types to double
-
     def postprocess(x):
         if isinstance(b,matrix):
             x = asmatrix(x)
@@ -86,6 +83,7 @@ def make_system(A, M, x0, b):
         xtype = A.dtype.char
     else:
         xtype = A.matvec(b).dtype.char
+    # coerce() upcasts non-FP types to double, so b is converted only once
     xtype = coerce(xtype, b.dtype.char)
 
     b = asarray(b,dtype=xtype)  # make b the same type as x
@@ -448,3 +448,12 @@ def test_transpose_noconjugate():
 
     assert_equal(B.dot(v), Y.dot(v))
     assert_equal(B.T.dot(v), Y.T.dot(v))
+
+def test_transpose_real_operator_complex_vector():
+    X = np.array([[1., 2.], [3., 4.]])
+    A = interface.aslinearoperator(X)
+
+    v = np.array([1j, 2])
+
+    assert_equal(A.T.dot(v), X.T.dot(v))
+    assert_equal(A.T.H.dot(v), X.dot(v))